@@ -1,10 +1,15 @@
-from fastapi import FastAPI, HTTPException, Body
-from typing import Dict
+from fastapi import FastAPI, HTTPException, Body, Query
+from typing import Dict, List, Optional
 import asyncio
 from datetime import datetime
 from pydantic import BaseModel, Field
 import os
+import re
 import json
+import gzip
+import uuid
+import time
+import shutil
 from playwright.async_api import async_playwright
 from playwright.async_api._generated import Page, Browser, BrowserContext
 import traceback
@@ -23,23 +28,61 @@ FB_CREDENTIALS = {
     "password": os.environ.get("FB_PASSWORD", "")
 }
 
+# Origin used for login; override with a local mock origin for load testing
+FB_BASE_URL = os.environ.get("FB_BASE_URL", "https://www.facebook.com").rstrip("/")
+
+# Where expanded-page snapshots are stored, and how many are re-extracted at once
+SNAPSHOT_DIR = os.environ.get("SNAPSHOT_DIR", "/tmp/fb_snapshots")
+REEXTRACT_CONCURRENCY = int(os.environ.get("REEXTRACT_CONCURRENCY", "8"))
+MAX_REEXTRACT_SNAPSHOTS = int(os.environ.get("MAX_REEXTRACT_SNAPSHOTS", "20"))
+
+# Comments are drained from the page in chunks and kept server-side for cursor paging
+COMMENT_CHUNK_SIZE = max(1, int(os.environ.get("COMMENT_CHUNK_SIZE", "500")))
+RESULTS_DIR = os.environ.get("RESULTS_DIR", "/tmp/fb_results")
+RESULTS_TTL_SECONDS = int(os.environ.get("RESULTS_TTL_SECONDS", "3600"))
+MAX_COMMENTS_PAGE_SIZE = 1000
+DEFAULT_COMMENTS_PAGE_SIZE = 100
+
 # Input model for better API documentation
 class PostRequest(BaseModel):
     post_url: str = Field(..., description="URL of the Facebook post to scrape")
+    save_snapshot: bool = Field(False, description="Save a compressed snapshot of the expanded page for offline re-extraction")
+    limit: Optional[int] = Field(None, ge=1, le=MAX_COMMENTS_PAGE_SIZE, description="Return only this many comments and a comments_cursor for the rest; all comments are returned if omitted")
+
+class ReextractRequest(BaseModel):
+    snapshot_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_REEXTRACT_SNAPSHOTS,
+        description="Snapshots to re-extract; use reextract_snapshots.py for bulk backfills"
+    )
 
 # Initialize browser once per cold start
+playwright_instance = None
 browser = None
 browser_context = None
+offline_context = None
 is_browser_initialized = False
 
+# Concurrent requests must not each launch their own browser or offline context
+browser_init_lock = asyncio.Lock()
+offline_context_lock = asyncio.Lock()
+
 async def initialize_browser():
-    global browser, browser_context, is_browser_initialized
-    
     if is_browser_initialized:
         return
+
+    async with browser_init_lock:
+        # Another request may have finished initialization while we waited
+        if is_browser_initialized:
+            return
+        await launch_browser()
+
+async def launch_browser():
+    global playwright_instance, browser, browser_context, is_browser_initialized
     
     try:
-        playwright = await async_playwright().start()
+        playwright_instance = await async_playwright().start()
         
         print("Starting browser initialization...")
         # Check if we're in Vercel environment
@@ -77,7 +120,7 @@ async def initialize_browser():
             ])
         
         print("Launching browser with arguments:", browser_args)
-        browser = await playwright.chromium.launch(
+        browser = await playwright_instance.chromium.launch(
             headless=True,
             args=browser_args
         )
@@ -194,7 +237,7 @@ async def initialize_browser():
 
 async def login_to_facebook(page):
     # Step 1: Login to Facebook
-    await page.goto('https://www.facebook.com/', timeout=60000)
+    await page.goto(f'{FB_BASE_URL}/', timeout=60000)
     
     # Wait for page to fully load
     await page.wait_for_load_state('networkidle')
@@ -227,17 +270,354 @@ async def login_to_facebook(page):
     if 'login' in page.url:
         raise HTTPException(status_code=401, detail='Login failed - Please check credentials')
 
-async def scrape_post(post_url):
+# In-page extraction scripts, shared by live scraping and offline re-extraction
+POST_EXTRACTION_JS = '''() => {
+    // Try to get the post description directly from where Facebook actually stores it
+    const getPostDescription = () => {
+        // First approach: Get the full text content from the post container
+        const postContainer = document.querySelector('.xjkvuk6, .xuyqlj2');
+        if (postContainer) {
+            // Get all text content divs in the post container
+            const textDivs = Array.from(postContainer.querySelectorAll('div[dir="auto"]'))
+                .map(el => el.textContent.trim())
+                .filter(text => text.length > 10 && !text.includes('See more') && !text.includes('See less'));
+            
+            // Get the full post content by joining all text segments (this gets the complete text even if split across divisions)
+            if (textDivs.length > 0) {
+                return textDivs.join(' ');
+            }
+        }
+        
+        // Second approach: Look for specific post wrapper divs by their class names
+        const wrapperSelectors = [
+            'div.x11i5rnm.xat24cr.x1mh8g0r.x1vvkbs',
+            'div.x78zum5.xdt5ytf.x4cne27.xifccgj',
+            'div.xzueoph.x1k70j0n',
+            'div.x1n2onr6'
+        ];
+        
+        for (const selector of wrapperSelectors) {
+            const wrappers = document.querySelectorAll(selector);
+            for (const wrapper of wrappers) {
+                const texts = Array.from(wrapper.querySelectorAll('div[dir="auto"], span[dir="auto"]'))
+                    .map(el => el.textContent.trim())
+                    .filter(text => 
+                        text.length > 30 && 
+                        !text.includes('See more') && 
+                        !text.includes('See less') &&
+                        !text.includes('#') // Avoid hashtag sections
+                    );
+                
+                if (texts.length > 0) {
+                    // Sort by length and get the longest text
+                    return texts.sort((a, b) => b.length - a.length)[0];
+                }
+            }
+        }
+        
+        // Third approach: look for any lengthy content in the first article element (likely the post itself)
+        const firstArticle = document.querySelector('div[role="article"]');
+        if (firstArticle) {
+            const articleTexts = Array.from(firstArticle.querySelectorAll('div[dir="auto"]'))
+                .map(el => el.textContent.trim())
+                .filter(text => 
+                    text.length > 40 && 
+                    !text.includes('See more') && 
+                    !text.includes('See less')
+                );
+            
+            if (articleTexts.length > 0) {
+                // Sort by length to get the most substantial content
+                return articleTexts.sort((a, b) => b.length - a.length)[0];
+            }
+        }
+        
+        // Final fallback: any meaningful content on the page
+        const allTextElements = Array.from(document.querySelectorAll('div[dir="auto"]'));
+        const allTexts = allTextElements
+            .map(el => el.textContent.trim())
+            .filter(text => text.length > 50);
+            
+        if (allTexts.length > 0) {
+            return allTexts.sort((a, b) => b.length - a.length)[0];
+        }
+        
+        return '';
+    };
+
+    return {
+        post_content: getPostDescription(),
+        post_url: window.location.href
+    };
+}'''
+
+COMMENTS_EXTRACTION_JS = '''({ offset, limit }) => {
+    const comments = [];
+
+    // Cache the element list between drains so each chunk doesn't re-query the whole thread
+    if (offset === 0 || !window.__fbCommentElements) {
+        window.__fbCommentElements = Array.from(document.querySelectorAll('div[role="article"]'));
+        console.log("Total comment elements found:", window.__fbCommentElements.length);
+    }
+    const commentElements = window.__fbCommentElements;
+    
+    // Skip the first element as it's likely the post itself
+    const actualComments = commentElements.slice(1 + offset, 1 + offset + limit);
+    
+    actualComments.forEach((comment, i) => {
+        const index = offset + i;
+        try {
+            // Extract the comment content
+            const contentElements = comment.querySelectorAll('div[dir="auto"]:not([style*="display: none"])');
+            let content = '';
+            
+            // Take the longest text content as the comment
+            contentElements.forEach(el => {
+                const text = el.textContent.trim();
+                if (text && text.length > content.length) {
+                    content = text;
+                }
+            });
+            
+            // Extract the author name using various selectors to catch different FB layouts
+            let author = '';
+            
+            // First try: Look for the author name in specific class patterns
+            const authorElements = [
+                // Common desktop FB pattern - strong tag with author name
+                ...comment.querySelectorAll('strong.x1heor9g, strong.html-strong'),
+                // Mobile FB pattern - span with author class
+                ...comment.querySelectorAll('span.f20'),
+                // Another common pattern - profile link with author name
+                ...comment.querySelectorAll('a[role="link"] span.xt0psk2, a[aria-label*="profile"] span'),
+                // Alternative pattern - any link within header area
+                ...comment.querySelectorAll('h3 a, h4 a, .x1heor9g a, .x11i5rnm a')
+            ];
+            
+            // Try to extract author from the found elements
+            for (const el of authorElements) {
+                const name = el.textContent.trim();
+                if (name && name.length > 0 && name.length < 50) {
+                    author = name;
+                    break;
+                }
+            }
+            
+            // If no author found with specific selectors, try more general approach
+            if (!author) {
+                // Look for typical author layout patterns
+                const topElements = Array.from(comment.querySelectorAll('div[dir="auto"]')).slice(0, 3);
+                for (const el of topElements) {
+                    const text = el.textContent.trim();
+                    // Author names are typically short and at the beginning of the comment
+                    if (text && text.length > 0 && text.length < 40 && 
+                        !text.includes("Commented") && !text.includes("replied") && 
+                        !text.includes("http") && !text.includes("www.")) {
+                        author = text;
+                        break;
+                    }
+                }
+            }
+            
+            if (content) {
+                comments.push({
+                    'comment': content,
+                    'author': author || 'Unknown User',
+                    'index': index
+                });
+            }
+        } catch (e) {
+            console.error('Error processing comment:', e);
+        }
+    });
+
+    const nextOffset = offset + actualComments.length;
+    const done = nextOffset >= commentElements.length - 1;
+    if (done) {
+        delete window.__fbCommentElements;
+    }
+
+    return { comments, next_offset: nextOffset, done };
+}'''
+
+async def extract_post(page):
+    return await page.evaluate(POST_EXTRACTION_JS)
+
+async def iter_comment_chunks(page, chunk_size=COMMENT_CHUNK_SIZE):
+    # Drain comments from the page in fixed-size chunks to keep each CDP payload small
+    offset = 0
+    while True:
+        chunk = await page.evaluate(COMMENTS_EXTRACTION_JS, {'offset': offset, 'limit': chunk_size})
+        yield chunk['comments']
+        if chunk['done']:
+            break
+        offset = chunk['next_offset']
+
+async def extract_comments(page):
+    comments = []
+    async for chunk in iter_comment_chunks(page):
+        comments.extend(chunk)
+    return comments
+
+def check_id(value, kind):
+    # Ids are generated hex strings; reject anything that could escape the storage directory
+    if not re.fullmatch(r'[0-9a-f]{32}', value):
+        raise HTTPException(status_code=400, detail=f"Invalid {kind} id: {value}")
+    return value
+
+def snapshot_path(snapshot_id):
+    return os.path.join(SNAPSHOT_DIR, f"{check_id(snapshot_id, 'snapshot')}.json.gz")
+
+def write_snapshot(snapshot):
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    path = snapshot_path(snapshot['snapshot_id'])
+    # Write under a temporary name so readers never see a half-written snapshot
+    with gzip.open(f"{path}.tmp", 'wt', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False)
+    os.replace(f"{path}.tmp", path)
+
+def read_snapshot(snapshot_id):
+    with gzip.open(snapshot_path(snapshot_id), 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+def list_snapshot_ids():
+    if not os.path.isdir(SNAPSHOT_DIR):
+        return []
+    return sorted(
+        name[:-len('.json.gz')] for name in os.listdir(SNAPSHOT_DIR)
+        if name.endswith('.json.gz')
+    )
+
+def result_dir(scrape_id):
+    return os.path.join(RESULTS_DIR, check_id(scrape_id, 'scrape'))
+
+def write_result_chunk(scrape_id, chunk_number, comments):
+    os.makedirs(result_dir(scrape_id), exist_ok=True)
+    with gzip.open(os.path.join(result_dir(scrape_id), f"chunk-{chunk_number}.json.gz"), 'wt', encoding='utf-8') as f:
+        json.dump(comments, f, ensure_ascii=False)
+
+def read_result_chunk(scrape_id, chunk_number):
+    try:
+        with gzip.open(os.path.join(result_dir(scrape_id), f"chunk-{chunk_number}.json.gz"), 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        # The result was pruned while it was being read
+        raise HTTPException(status_code=404, detail=f"No finished scrape found with id: {scrape_id}")
+
+def write_result_manifest(scrape_id, manifest):
+    # Written last and moved into place, so a manifest only exists for finished scrapes
+    os.makedirs(result_dir(scrape_id), exist_ok=True)
+    path = os.path.join(result_dir(scrape_id), "manifest.json")
+    with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(f"{path}.tmp", path)
+
+def store_result(post, metadata, comments):
+    # Store an already extracted result so its comments can be paged like a scrape
+    scrape_id = uuid.uuid4().hex
+    chunk_sizes = []
+    for start in range(0, len(comments), COMMENT_CHUNK_SIZE):
+        chunk = comments[start:start + COMMENT_CHUNK_SIZE]
+        write_result_chunk(scrape_id, len(chunk_sizes), chunk)
+        chunk_sizes.append(len(chunk))
+    manifest = {
+        'scrape_id': scrape_id,
+        'post': post,
+        'metadata': {**metadata, 'scrape_id': scrape_id},
+        'chunk_sizes': chunk_sizes
+    }
+    write_result_manifest(scrape_id, manifest)
+    return manifest
+
+def read_result_manifest(scrape_id):
+    path = os.path.join(result_dir(scrape_id), "manifest.json")
+    try:
+        # Expired results are treated as gone even if they have not been pruned yet
+        if os.path.getmtime(path) < time.time() - RESULTS_TTL_SECONDS:
+            raise FileNotFoundError(path)
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"No finished scrape found with id: {scrape_id}")
+
+def read_comments_page(scrape_id, cursor, limit):
+    # Only the chunks overlapping [cursor, cursor + limit) are loaded
+    manifest = read_result_manifest(scrape_id)
+    total_comments = manifest['metadata']['total_comments']
+    end = min(cursor + limit, total_comments)
+    comments = []
+    chunk_start = 0
+    for chunk_number, chunk_size in enumerate(manifest['chunk_sizes']):
+        chunk_end = chunk_start + chunk_size
+        if chunk_end > cursor and chunk_start < end:
+            chunk = read_result_chunk(scrape_id, chunk_number)
+            comments.extend(chunk[max(cursor - chunk_start, 0):end - chunk_start])
+        if chunk_end >= end:
+            break
+        chunk_start = chunk_end
+    next_cursor = end if end < total_comments else None
+    return comments, next_cursor, manifest
+
+def prune_results():
+    if not os.path.isdir(RESULTS_DIR):
+        return
+    cutoff = time.time() - RESULTS_TTL_SECONDS
+    for name in os.listdir(RESULTS_DIR):
+        path = os.path.join(RESULTS_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+
+async def save_snapshot(page, post_url, json_responses, total_clicks):
+    # Capture the fully expanded DOM plus the JSON responses seen while loading it
+    responses = []
+    for response in json_responses:
+        try:
+            responses.append({
+                'url': response.url,
+                'status': response.status,
+                'body': await response.text()
+            })
+        except Exception as e:
+            print(f"Could not read response body for {response.url}: {str(e)}")
+
+    snapshot = {
+        'snapshot_id': uuid.uuid4().hex,
+        'post_url': post_url,
+        'page_url': page.url,
+        'captured_at': datetime.now().isoformat(),
+        'clicks_to_expand': total_clicks,
+        'html': await page.content(),
+        'responses': responses
+    }
+    await asyncio.to_thread(write_snapshot, snapshot)
+    print(f"Saved snapshot {snapshot['snapshot_id']} for {post_url}")
+    return snapshot['snapshot_id']
+
+async def scrape_post(post_url, save_snapshot_enabled=False, limit=None):
     # Initialize browser if needed
     await initialize_browser()
     
     # Create a new page
     page = await browser_context.new_page()
+
+    # Keep JSON responses around so they can be stored with the snapshot
+    json_responses = []
     
     try:
         # Login to Facebook
         await login_to_facebook(page)
 
+        # Only capture the post's own traffic, never the login/session responses
+        if save_snapshot_enabled:
+            def on_response(response):
+                content_type = response.headers.get('content-type', '')
+                if 'json' in content_type or '/api/graphql' in response.url:
+                    json_responses.append(response)
+            page.on('response', on_response)
+
         # Navigate to post
         print(f"Navigating to post URL: {post_url}")
         await page.goto(post_url, timeout=60000)
@@ -245,85 +625,7 @@ async def scrape_post(post_url):
         await asyncio.sleep(5)  # Wait longer for all elements to load
 
         # Get post content
-        post_data = await page.evaluate('''() => {
-            // Try to get the post description directly from where Facebook actually stores it
-            const getPostDescription = () => {
-                // First approach: Get the full text content from the post container
-                const postContainer = document.querySelector('.xjkvuk6, .xuyqlj2');
-                if (postContainer) {
-                    // Get all text content divs in the post container
-                    const textDivs = Array.from(postContainer.querySelectorAll('div[dir="auto"]'))
-                        .map(el => el.textContent.trim())
-                        .filter(text => text.length > 10 && !text.includes('See more') && !text.includes('See less'));
-                    
-                    // Get the full post content by joining all text segments (this gets the complete text even if split across divisions)
-                    if (textDivs.length > 0) {
-                        return textDivs.join(' ');
-                    }
-                }
-                
-                // Second approach: Look for specific post wrapper divs by their class names
-                const wrapperSelectors = [
-                    'div.x11i5rnm.xat24cr.x1mh8g0r.x1vvkbs',
-                    'div.x78zum5.xdt5ytf.x4cne27.xifccgj',
-                    'div.xzueoph.x1k70j0n',
-                    'div.x1n2onr6'
-                ];
-                
-                for (const selector of wrapperSelectors) {
-                    const wrappers = document.querySelectorAll(selector);
-                    for (const wrapper of wrappers) {
-                        const texts = Array.from(wrapper.querySelectorAll('div[dir="auto"], span[dir="auto"]'))
-                            .map(el => el.textContent.trim())
-                            .filter(text => 
-                                text.length > 30 && 
-                                !text.includes('See more') && 
-                                !text.includes('See less') &&
-                                !text.includes('#') // Avoid hashtag sections
-                            );
-                        
-                        if (texts.length > 0) {
-                            // Sort by length and get the longest text
-                            return texts.sort((a, b) => b.length - a.length)[0];
-                        }
-                    }
-                }
-                
-                // Third approach: look for any lengthy content in the first article element (likely the post itself)
-                const firstArticle = document.querySelector('div[role="article"]');
-                if (firstArticle) {
-                    const articleTexts = Array.from(firstArticle.querySelectorAll('div[dir="auto"]'))
-                        .map(el => el.textContent.trim())
-                        .filter(text => 
-                            text.length > 40 && 
-                            !text.includes('See more') && 
-                            !text.includes('See less')
-                        );
-                    
-                    if (articleTexts.length > 0) {
-                        // Sort by length to get the most substantial content
-                        return articleTexts.sort((a, b) => b.length - a.length)[0];
-                    }
-                }
-                
-                // Final fallback: any meaningful content on the page
-                const allTextElements = Array.from(document.querySelectorAll('div[dir="auto"]'));
-                const allTexts = allTextElements
-                    .map(el => el.textContent.trim())
-                    .filter(text => text.length > 50);
-                    
-                if (allTexts.length > 0) {
-                    return allTexts.sort((a, b) => b.length - a.length)[0];
-                }
-                
-                return '';
-            };
-
-            return {
-                post_content: getPostDescription(),
-                post_url: window.location.href
-            };
-        }''')
+        post_data = await extract_post(page)
 
         # Expand comments
         max_attempts = 20  # Maximum attempts for loading more comments
@@ -393,101 +695,64 @@ async def scrape_post(post_url):
             if attempts >= 3 and total_clicks == 0:
                 break  # Break early if we can't find any buttons to click
 
-        # Scrape the comments
-        comments = await page.evaluate('''() => {
-            const comments = [];
-            const commentElements = Array.from(document.querySelectorAll('div[role="article"]'));
-            
-            console.log("Total comment elements found:", commentElements.length);
-            
-            // Skip the first element as it's likely the post itself
-            const actualComments = commentElements.slice(1);
-            
-            actualComments.forEach((comment, index) => {
-                try {
-                    // Extract the comment content
-                    const contentElements = comment.querySelectorAll('div[dir="auto"]:not([style*="display: none"])');
-                    let content = '';
-                    
-                    // Take the longest text content as the comment
-                    contentElements.forEach(el => {
-                        const text = el.textContent.trim();
-                        if (text && text.length > content.length) {
-                            content = text;
-                        }
-                    });
-                    
-                    // Extract the author name using various selectors to catch different FB layouts
-                    let author = '';
-                    
-                    // First try: Look for the author name in specific class patterns
-                    const authorElements = [
-                        // Common desktop FB pattern - strong tag with author name
-                        ...comment.querySelectorAll('strong.x1heor9g, strong.html-strong'),
-                        // Mobile FB pattern - span with author class
-                        ...comment.querySelectorAll('span.f20'),
-                        // Another common pattern - profile link with author name
-                        ...comment.querySelectorAll('a[role="link"] span.xt0psk2, a[aria-label*="profile"] span'),
-                        // Alternative pattern - any link within header area
-                        ...comment.querySelectorAll('h3 a, h4 a, .x1heor9g a, .x11i5rnm a')
-                    ];
-                    
-                    // Try to extract author from the found elements
-                    for (const el of authorElements) {
-                        const name = el.textContent.trim();
-                        if (name && name.length > 0 && name.length < 50) {
-                            author = name;
-                            break;
-                        }
-                    }
-                    
-                    // If no author found with specific selectors, try more general approach
-                    if (!author) {
-                        // Look for typical author layout patterns
-                        const topElements = Array.from(comment.querySelectorAll('div[dir="auto"]')).slice(0, 3);
-                        for (const el of topElements) {
-                            const text = el.textContent.trim();
-                            // Author names are typically short and at the beginning of the comment
-                            if (text && text.length > 0 && text.length < 40 && 
-                                !text.includes("Commented") && !text.includes("replied") && 
-                                !text.includes("http") && !text.includes("www.")) {
-                                author = text;
-                                break;
-                            }
-                        }
-                    }
-                    
-                    if (content) {
-                        comments.push({
-                            'comment': content,
-                            'author': author || 'Unknown User',
-                            'index': index
-                        });
-                    }
-                } catch (e) {
-                    console.error('Error processing comment:', e);
-                }
-            });
+        # Store the expanded page so extraction can be re-run offline later
+        snapshot_id = None
+        if save_snapshot_enabled:
+            try:
+                snapshot_id = await save_snapshot(page, post_url, json_responses, total_clicks)
+            except Exception as e:
+                print(f"Failed to save snapshot: {str(e)}")
 
-            return comments;
-        }''')
+        post = {
+            'content': post_data['post_content'],
+            'url': post_data['post_url']
+        }
+        metadata = {
+            'scraped_at': datetime.now().isoformat(),
+            'clicks_to_expand': total_clicks
+        }
+        if save_snapshot_enabled:
+            metadata['snapshot_id'] = snapshot_id
 
-        # Format the data
-        formatted_data = {
-            'post': {
-                'content': post_data['post_content'],
-                'url': post_data['post_url']
-            },
-            'comments': comments,
-            'metadata': {
-                'total_comments': len(comments),
-                'scraped_at': datetime.now().isoformat(),
-                'clicks_to_expand': total_clicks
+        # Without a limit, return every comment in one response
+        if limit is None:
+            comments = await extract_comments(page)
+            await page.close()
+            return {
+                'post': post,
+                'comments': comments,
+                'metadata': {'total_comments': len(comments), **metadata}
             }
-        }
+
+        # Otherwise scrape the comments chunk by chunk into the server-side result store
+        scrape_id = uuid.uuid4().hex
+        await asyncio.to_thread(prune_results)
+        chunk_sizes = []
+        async for chunk in iter_comment_chunks(page):
+            if chunk:
+                await asyncio.to_thread(write_result_chunk, scrape_id, len(chunk_sizes), chunk)
+                chunk_sizes.append(len(chunk))
 
         # Close the page (but keep the browser running for future requests)
         await page.close()
+
+        manifest = {
+            'scrape_id': scrape_id,
+            'post': post,
+            'metadata': {'total_comments': sum(chunk_sizes), **metadata, 'scrape_id': scrape_id},
+            'chunk_sizes': chunk_sizes
+        }
+        await asyncio.to_thread(write_result_manifest, scrape_id, manifest)
+
+        comments, next_cursor, _ = await asyncio.to_thread(read_comments_page, scrape_id, 0, limit)
+
+        # Format the data
+        formatted_data = {
+            'post': manifest['post'],
+            'comments': comments,
+            'comments_cursor': next_cursor,
+            'metadata': manifest['metadata']
+        }
         
         return formatted_data
 
@@ -524,17 +789,127 @@ async def scrape_facebook_post(request: PostRequest):
     post_url = request.post_url
     
     # Scrape the post
-    result = await scrape_post(post_url)
+    result = await scrape_post(
+        post_url,
+        save_snapshot_enabled=request.save_snapshot,
+        limit=request.limit
+    )
     
     return result
 
+@app.get("/api/scrape-results/{scrape_id}/comments")
+async def get_scrape_comments(
+    scrape_id: str,
+    comments_cursor: int = Query(0, ge=0, description="Cursor returned by the previous page"),
+    limit: int = Query(DEFAULT_COMMENTS_PAGE_SIZE, ge=1, le=MAX_COMMENTS_PAGE_SIZE, description="Maximum number of comments to return")
+):
+    comments, next_cursor, manifest = await asyncio.to_thread(read_comments_page, scrape_id, comments_cursor, limit)
+    return {
+        'scrape_id': scrape_id,
+        'comments': comments,
+        'comments_cursor': next_cursor,
+        'total_comments': manifest['metadata']['total_comments']
+    }
+
+async def get_offline_context():
+    global offline_context
+
+    await initialize_browser()
+    async with offline_context_lock:
+        if offline_context is None:
+            # Offline context: snapshots are rendered without any network access or login
+            context = await browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                java_script_enabled=True,
+                offline=True,
+            )
+            await context.route('**/*', lambda route: route.abort())
+            offline_context = context
+    return offline_context
+
+async def reextract_snapshot(snapshot_id):
+    snapshot = await asyncio.to_thread(read_snapshot, snapshot_id)
+
+    # Drop the page's own scripts so only the extraction scripts run against the stored DOM
+    html = re.sub(r'<script\b[^>]*>.*?</script>', '', snapshot['html'], flags=re.IGNORECASE | re.DOTALL)
+
+    context = await get_offline_context()
+    page = await context.new_page()
+    try:
+        await page.set_content(html, wait_until='domcontentloaded')
+        post_data = await extract_post(page)
+        comments = await extract_comments(page)
+    finally:
+        await page.close()
+
+    return {
+        'post': {
+            'content': post_data['post_content'],
+            'url': snapshot.get('page_url') or snapshot['post_url']
+        },
+        'comments': comments,
+        'metadata': {
+            'total_comments': len(comments),
+            'scraped_at': snapshot['captured_at'],
+            'reextracted_at': datetime.now().isoformat(),
+            'clicks_to_expand': snapshot.get('clicks_to_expand', 0),
+            'snapshot_id': snapshot_id
+        }
+    }
+
+async def reextract_snapshots(snapshot_ids, on_result, concurrency=REEXTRACT_CONCURRENCY):
+    # Each result is handed to on_result(result, error) as soon as it is ready,
+    # so memory is bounded by the snapshots in flight rather than the whole batch
+    if snapshot_ids is None:
+        snapshot_ids = await asyncio.to_thread(list_snapshot_ids)
+
+    pending = iter(snapshot_ids)
+    counts = {'processed': 0, 'failed': 0}
+
+    async def worker():
+        for snapshot_id in pending:
+            try:
+                result, error = await reextract_snapshot(snapshot_id), None
+            except Exception as e:
+                detail = e.detail if isinstance(e, HTTPException) else str(e)
+                print(f"Error re-extracting snapshot {snapshot_id}: {detail}")
+                result, error = None, {'snapshot_id': snapshot_id, 'error': detail}
+            counts['failed' if error else 'processed'] += 1
+            await on_result(result, error)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return counts
+
+@app.post("/api/reextract-snapshots")
+async def reextract_snapshots_endpoint(request: ReextractRequest):
+    # Runs extraction against stored snapshots only - no login or navigation needed.
+    # Comments are kept in the result store; the response only carries ids and counts.
+    results = []
+    errors = []
+
+    async def on_result(result, error):
+        if error:
+            errors.append(error)
+            return
+        manifest = await asyncio.to_thread(store_result, result['post'], result['metadata'], result['comments'])
+        results.append({
+            'snapshot_id': result['metadata']['snapshot_id'],
+            'scrape_id': manifest['scrape_id'],
+            'total_comments': manifest['metadata']['total_comments']
+        })
+
+    await reextract_snapshots(request.snapshot_ids, on_result)
+    return {'results': results, 'errors': errors}
+
 @app.get("/")
 async def root():
     return {
         "message": "Facebook Post Scraper API is running!",
         "version": "1.0.0",
         "endpoints": {
-            "POST /api/scrape-facebook-post": "Scrape a Facebook post and its comments"
+            "POST /api/scrape-facebook-post": "Scrape a Facebook post and its comments",
+            "POST /api/reextract-snapshots": "Re-run extraction against stored snapshots without scraping",
+            "GET /api/scrape-results/{scrape_id}/comments": "Page through the comments of a finished scrape"
         },
         "usage": "Send a POST request to /api/scrape-facebook-post with JSON body: {'post_url': 'https://www.facebook.com/your-post-url'}"
     }
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Load generator for the scraper API.
+Fires a weighted mix of requests at the API with a fixed number of concurrent
+workers for a fixed duration, then reports latency percentiles, throughput
+and error rates. Run it against an API whose FB_BASE_URL points at
+mock_facebook.py to load-test without live credentials.
+"""
+
+import argparse
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def parse_mix(mix):
+    """Parse a request mix such as 'scrape=9,root=1' into (name, weight) pairs."""
+    weights = []
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("scrape", "root"):
+            raise ValueError(f"Unknown request type in mix: {name}")
+        weight = float(weight or 1)
+        if weight < 0:
+            raise ValueError(f"Negative weight in mix: {part}")
+        weights.append((name, weight))
+    if not any(weight > 0 for _, weight in weights):
+        raise ValueError(f"Request mix needs at least one positive weight: {mix}")
+    return weights
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100.0 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def positive_int(value):
+    """argparse type for integers that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def send_request(session, api_url, kind, post_urls, timeout):
+    """Send one request of the given kind and return (ok, latency, error)."""
+    start = time.perf_counter()
+    try:
+        if kind == "scrape":
+            response = session.post(
+                f"{api_url}/api/scrape-facebook-post",
+                json={"post_url": random.choice(post_urls)},
+                timeout=timeout
+            )
+        else:
+            response = session.get(api_url, timeout=timeout)
+        latency = time.perf_counter() - start
+        if response.status_code == 200:
+            return True, latency, None
+        return False, latency, f"HTTP {response.status_code}"
+    except Exception as e:
+        return False, time.perf_counter() - start, type(e).__name__
+
+
+def worker(api_url, mix, post_urls, deadline, timeout, results, lock):
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    session = requests.Session()
+    while time.monotonic() < deadline:
+        kind = random.choices(names, weights=weights)[0]
+        ok, latency, error = send_request(session, api_url, kind, post_urls, timeout)
+        with lock:
+            results.append((kind, ok, latency, error))
+
+
+def report(results, elapsed):
+    print(f"\nLoad Test Results ({elapsed:.1f}s)")
+    kinds = sorted({kind for kind, _, _, _ in results})
+    for kind in ["all"] + kinds:
+        rows = [r for r in results if kind == "all" or r[0] == kind]
+        if not rows:
+            continue
+        latencies = sorted(latency for _, _, latency, _ in rows)
+        errors = [error for _, ok, _, error in rows if not ok]
+        print(f"\n[{kind}]")
+        print(f"Requests: {len(rows)}")
+        print(f"Throughput: {len(rows) / elapsed:.2f} req/s")
+        print(f"Error rate: {len(errors) / len(rows) * 100:.1f}%")
+        print(f"Latency p50: {percentile(latencies, 50):.3f}s")
+        print(f"Latency p95: {percentile(latencies, 95):.3f}s")
+        print(f"Latency p99: {percentile(latencies, 99):.3f}s")
+        for error in sorted(set(errors)):
+            print(f"  {error}: {errors.count(error)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Facebook scraper API")
+    parser.add_argument("--api-url", default="http://localhost:8000")
+    parser.add_argument("--mock-origin", default="http://127.0.0.1:8080",
+                        help="Mock origin used to build post URLs when --post-url is not given")
+    parser.add_argument("--post-url", action="append", dest="post_urls",
+                        help="Post URL to scrape (repeatable)")
+    parser.add_argument("--posts", type=int, default=10,
+                        help="Number of distinct mock post URLs to rotate through")
+    parser.add_argument("--concurrency", type=positive_int, default=4)
+    parser.add_argument("--duration", type=float, default=60, help="Test duration in seconds")
+    parser.add_argument("--mix", default="scrape=1", help="Weighted request mix, e.g. 'scrape=9,root=1'")
+    parser.add_argument("--timeout", type=float, default=120, help="Per-request timeout in seconds")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    post_urls = args.post_urls or [
+        f"{args.mock_origin.rstrip('/')}/posts/{i}" for i in range(args.posts)
+    ]
+    api_url = args.api_url.rstrip("/")
+
+    print(f"Load testing {api_url} with concurrency={args.concurrency}, "
+          f"duration={args.duration}s, mix={args.mix}")
+
+    results = []
+    lock = threading.Lock()
+    start = time.monotonic()
+    deadline = start + args.duration
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = [
+            executor.submit(worker, api_url, mix, post_urls, deadline, args.timeout, results, lock)
+            for _ in range(args.concurrency)
+        ]
+        # Surface worker failures instead of reporting an empty run
+        for future in futures:
+            future.result()
+
+    report(results, time.monotonic() - start)
+
+
+if __name__ == "__main__":
+    main()
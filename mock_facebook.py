@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Local mock of the Facebook pages the scraper touches.
+Serves a login form, post pages and paginated "View more comments" loading
+with configurable delays, so the API can be load-tested without credentials
+or network access. Point the API at it with FB_BASE_URL.
+"""
+
+import argparse
+import html
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+LOGIN_PAGE = '''<!DOCTYPE html>
+<html><head><title>Log in</title></head>
+<body>
+  <form method="post" action="/login/">
+    <input id="email" name="email" type="text">
+    <input id="pass" name="pass" type="password">
+    <button name="login" type="submit">Log in</button>
+  </form>
+</body></html>'''
+
+HOME_PAGE = '''<!DOCTYPE html>
+<html><head><title>Home</title></head>
+<body><div role="main">Mock news feed</div></body></html>'''
+
+POST_PAGE = '''<!DOCTYPE html>
+<html><head><title>Post {post_id}</title></head>
+<body>
+  <div role="article">
+    <div class="xjkvuk6"><div dir="auto">{content}</div></div>
+  </div>
+  <div id="comments">{comments}</div>
+  {more_button}
+  <script>
+    let nextPage = 1;
+    const button = document.getElementById('more-comments');
+    if (button) {{
+      button.addEventListener('click', async () => {{
+        const response = await fetch('/api/comments?post={post_id}&page=' + nextPage);
+        const data = await response.json();
+        document.getElementById('comments').insertAdjacentHTML('beforeend', data.html);
+        nextPage += 1;
+        if (!data.has_more) {{
+          button.remove();
+        }}
+      }});
+    }}
+  </script>
+</body></html>'''
+
+MORE_BUTTON = '<div role="button" id="more-comments"><span>View more comments</span></div>'
+
+
+def render_comments(post_id, page, per_page):
+    """Render one page of comment articles for a post."""
+    items = []
+    for i in range(page * per_page, (page + 1) * per_page):
+        items.append(
+            '<div role="article">'
+            f'<strong class="html-strong">Mock User {i}</strong>'
+            f'<div dir="auto">Comment {i} on post {html.escape(post_id)}: lorem ipsum dolor sit amet</div>'
+            '</div>'
+        )
+    return ''.join(items)
+
+
+class MockFacebookHandler(BaseHTTPRequestHandler):
+    # Populated from the command line in main()
+    config = {}
+
+    def log_message(self, format, *args):
+        if self.config.get("verbose"):
+            super().log_message(format, *args)
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+
+        if path == "/":
+            time.sleep(self.config["login_delay"])
+            self._send(200, LOGIN_PAGE)
+        elif path == "/home.php":
+            self._send(200, HOME_PAGE)
+        elif path.startswith("/posts/"):
+            time.sleep(self.config["post_delay"])
+            post_id = path[len("/posts/"):].strip("/") or "0"
+            self._send(200, POST_PAGE.format(
+                post_id=html.escape(post_id),
+                content=f"Mock post {html.escape(post_id)} with enough text to be picked up as the description.",
+                comments=render_comments(post_id, 0, self.config["comments_per_page"]),
+                more_button=MORE_BUTTON if self.config["comment_pages"] > 1 else "",
+            ))
+        elif path == "/api/comments":
+            time.sleep(self.config["comments_delay"])
+            query = parse_qs(parsed.query)
+            post_id = query.get("post", ["0"])[0]
+            try:
+                page = int(query.get("page", ["1"])[0])
+            except ValueError:
+                self._send(400, "Invalid page", content_type="text/plain")
+                return
+            self._send(200, json.dumps({
+                "html": render_comments(post_id, page, self.config["comments_per_page"]),
+                "has_more": page + 1 < self.config["comment_pages"],
+            }), content_type="application/json")
+        else:
+            self._send(404, "Not found", content_type="text/plain")
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") == "/login":
+            length = int(self.headers.get("Content-Length", 0))
+            self.rfile.read(length)
+            time.sleep(self.config["login_delay"])
+            self._send(302, "", headers={"Location": "/home.php"})
+        else:
+            self._send(404, "Not found", content_type="text/plain")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local mock Facebook origin for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--login-delay", type=float, default=0.0, help="Seconds to delay login responses")
+    parser.add_argument("--post-delay", type=float, default=0.0, help="Seconds to delay post page responses")
+    parser.add_argument("--comments-delay", type=float, default=0.0, help="Seconds to delay each comments page")
+    parser.add_argument("--comment-pages", type=int, default=3, help="Number of comment pages per post")
+    parser.add_argument("--comments-per-page", type=int, default=10)
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    MockFacebookHandler.config = {
+        "login_delay": args.login_delay,
+        "post_delay": args.post_delay,
+        "comments_delay": args.comments_delay,
+        "comment_pages": args.comment_pages,
+        "comments_per_page": args.comments_per_page,
+        "verbose": args.verbose,
+    }
+
+    server = ThreadingHTTPServer((args.host, args.port), MockFacebookHandler)
+    print(f"Mock Facebook origin listening on http://{args.host}:{args.port}")
+    print(f"Post pages are served at http://{args.host}:{args.port}/posts/<id>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Re-run post/comment extraction against stored page snapshots.
+Snapshots are saved by the API when a scrape is requested with
+"save_snapshot": true. No login or navigation happens here, so backfills
+after extraction fixes only cost a local render per snapshot. Results are
+written as JSON lines, one per snapshot, as soon as each one finishes.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "api"))
+
+import index
+
+
+async def run(snapshot_ids, concurrency, output):
+    async def on_result(result, error):
+        if error:
+            print(f"  {error['snapshot_id']}: {error['error']}")
+            output.write(json.dumps(error, ensure_ascii=False) + "\n")
+        else:
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    try:
+        return await index.reextract_snapshots(snapshot_ids, on_result, concurrency=concurrency)
+    finally:
+        if index.browser:
+            await index.browser.close()
+        if index.playwright_instance:
+            await index.playwright_instance.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract posts and comments from stored snapshots")
+    parser.add_argument("snapshot_ids", nargs="*", help="Snapshot ids to process (default: all)")
+    parser.add_argument("--snapshot-dir", help="Snapshot directory (default: $SNAPSHOT_DIR or /tmp/fb_snapshots)")
+    parser.add_argument("--concurrency", type=int, default=index.REEXTRACT_CONCURRENCY,
+                        help="Number of snapshots rendered in parallel")
+    parser.add_argument("--output", default="reextract_result.jsonl", help="JSON lines file to write results to")
+    args = parser.parse_args()
+
+    if args.snapshot_dir:
+        index.SNAPSHOT_DIR = args.snapshot_dir
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        counts = asyncio.run(run(args.snapshot_ids or None, args.concurrency, output))
+
+    print(f"Re-extracted snapshots: {counts['processed']}")
+    print(f"Failed snapshots: {counts['failed']}")
+    print(f"\nFull results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
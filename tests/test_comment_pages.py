@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+
+import pytest
+from fastapi import HTTPException
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+
+import index
+
+
+@pytest.fixture(autouse=True)
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(index, "RESULTS_DIR", str(tmp_path))
+    return tmp_path
+
+
+def store(chunk_sizes):
+    """Store a result whose comments are numbered 0..n-1 across the given chunks."""
+    scrape_id = "a" * 32
+    start = 0
+    for chunk_number, chunk_size in enumerate(chunk_sizes):
+        index.write_result_chunk(scrape_id, chunk_number, list(range(start, start + chunk_size)))
+        start += chunk_size
+    index.write_result_manifest(scrape_id, {
+        'scrape_id': scrape_id,
+        'post': {'content': '', 'url': ''},
+        'metadata': {'total_comments': start, 'scrape_id': scrape_id},
+        'chunk_sizes': chunk_sizes
+    })
+    return scrape_id, start
+
+
+def test_every_cursor_and_limit():
+    scrape_id, total = store([3, 2, 4])
+    for cursor in range(0, 11):
+        for limit in range(1, 11):
+            comments, next_cursor, _ = index.read_comments_page(scrape_id, cursor, limit)
+            end = min(cursor + limit, total)
+            assert comments == list(range(cursor, end))
+            assert next_cursor == (end if end < total else None)
+
+
+def test_cursor_past_end():
+    scrape_id, _ = store([3, 2, 4])
+    assert index.read_comments_page(scrape_id, 50, 10)[:2] == ([], None)
+
+
+def test_zero_comments():
+    scrape_id, _ = store([])
+    assert index.read_comments_page(scrape_id, 0, 10)[:2] == ([], None)
+
+
+def test_store_result_chunks_comments(monkeypatch):
+    monkeypatch.setattr(index, "COMMENT_CHUNK_SIZE", 4)
+    manifest = index.store_result({'content': '', 'url': ''}, {'total_comments': 10}, list(range(10)))
+    assert manifest['chunk_sizes'] == [4, 4, 2]
+    comments, next_cursor, _ = index.read_comments_page(manifest['scrape_id'], 3, 6)
+    assert (comments, next_cursor) == (list(range(3, 9)), 9)
+
+
+def test_check_id_rejects_path_traversal():
+    assert index.check_id("b" * 32, "scrape") == "b" * 32
+    for value in ["../" + "a" * 29, "../../etc/passwd", "A" * 32, ""]:
+        with pytest.raises(HTTPException) as error:
+            index.check_id(value, "scrape")
+        assert error.value.status_code == 400
+
+
+def test_unknown_scrape_is_404():
+    with pytest.raises(HTTPException) as error:
+        index.read_comments_page("c" * 32, 0, 10)
+    assert error.value.status_code == 404
+
+
+def test_expired_result_is_404(monkeypatch):
+    scrape_id, _ = store([3])
+    monkeypatch.setattr(index, "RESULTS_TTL_SECONDS", 60)
+    manifest = os.path.join(index.result_dir(scrape_id), "manifest.json")
+    old = time.time() - 120
+    os.utime(manifest, (old, old))
+    with pytest.raises(HTTPException) as error:
+        index.read_comments_page(scrape_id, 0, 10)
+    assert error.value.status_code == 404
+
+
+def test_missing_chunk_is_404():
+    scrape_id, _ = store([3, 2])
+    os.remove(os.path.join(index.result_dir(scrape_id), "chunk-1.json.gz"))
+    with pytest.raises(HTTPException) as error:
+        index.read_comments_page(scrape_id, 0, 10)
+    assert error.value.status_code == 404
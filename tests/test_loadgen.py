@@ -0,0 +1,36 @@
+import argparse
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from loadgen import parse_mix, percentile, positive_int
+
+
+def test_percentile_nearest_rank():
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile(list(range(1, 22)), 50) == 11
+    assert percentile(list(range(1, 101)), 95) == 95
+    assert percentile(list(range(1, 101)), 99) == 99
+    assert percentile([7], 99) == 7
+    assert percentile([1, 2, 3], 0) == 1
+    assert percentile([], 50) == 0.0
+
+
+def test_parse_mix():
+    assert parse_mix("scrape=9,root=1") == [("scrape", 9.0), ("root", 1.0)]
+    assert parse_mix("scrape") == [("scrape", 1.0)]
+    with pytest.raises(ValueError):
+        parse_mix("scrape=0")
+    with pytest.raises(ValueError):
+        parse_mix("scrape=1,root=-1")
+    with pytest.raises(ValueError):
+        parse_mix("unknown=1")
+
+
+def test_positive_int():
+    assert positive_int("3") == 3
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int("0")